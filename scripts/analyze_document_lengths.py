@@ -6,8 +6,76 @@ Analyzes markdown documentation files for length issues and provides optimizatio
 """
 
 import os
-import re
-from collections import defaultdict
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class DocResult:
+    """Length analysis result for a single document"""
+
+    filename: str
+    line_count: int
+    category: str
+    recommendation: str
+    priority: str
+
+
+# Display labels for each length category
+_CATEGORY_LABELS = {
+    'short': 'SHORT',
+    'medium': 'MEDIUM',
+    'long': 'LONG',
+    'very_long': 'VERY LONG'
+}
+
+# Raw descriptors skip the BufferedReader setup; O_BINARY only exists on Windows
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+_READ_SIZE = 1 << 20
+
+# Read buffers are reused per worker thread rather than allocated per file
+_thread_buffers = threading.local()
+
+
+def _read_into(fd, buf):
+    """Fill buf from fd, returning the number of bytes read"""
+    if hasattr(os, 'readv'):
+        return os.readv(fd, [buf])
+    data = os.read(fd, len(buf))
+    buf[:len(data)] = data
+    return len(data)
+
+
+def _count_lines(entry):
+    """Count lines in a file, returning (name, line_count)"""
+
+    # DirEntry caches its stat result; empty files never need opening
+    remaining = entry.stat().st_size
+    if remaining == 0:
+        return entry.name, 0
+
+    buf = getattr(_thread_buffers, 'buf', None)
+    if buf is None:
+        buf = _thread_buffers.buf = bytearray(_READ_SIZE)
+
+    # Stream the file in binary chunks; only the newline count is needed.
+    # Stopping at the known size saves the trailing read that would hit EOF.
+    line_count = 0
+    last_byte = None
+    fd = os.open(entry.path, _OPEN_FLAGS)
+    try:
+        while remaining > 0 and (size := _read_into(fd, buf)):
+            remaining -= size
+            line_count += buf.count(b'\n', 0, size)
+            last_byte = buf[size - 1]
+    finally:
+        os.close(fd)
+    # Match readlines(): a trailing line without a newline still counts
+    if last_byte is not None and last_byte != ord('\n'):
+        line_count += 1
+    return entry.name, line_count
 
 
 def analyze_document_lengths(docs_dir='docs'):
@@ -31,7 +99,8 @@ def analyze_document_lengths(docs_dir='docs'):
 
     # Analyze each document
     results = []
-    category_counts = defaultdict(int)
+    high_priority = []
+    short_count = medium_count = long_count = very_long_count = 0
     total_lines = 0
     total_files = 0
 
@@ -43,74 +112,101 @@ def analyze_document_lengths(docs_dir='docs'):
         print(f"Directory '{docs_dir}' not found")
         return results
 
-    for filename in os.listdir(docs_dir):
-        if filename.endswith('.md'):
-            filepath = os.path.join(docs_dir, filename)
-            total_files += 1
+    # DirEntry carries the joined path and cached file type
+    with os.scandir(docs_dir) as it:
+        md_entries = [entry for entry in it if entry.name.endswith('.md') and entry.is_file()]
 
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                line_count = len(lines)
-                total_lines += line_count
+    # Counting is I/O-bound, so read files concurrently; results keep scandir order
+    line_counts = []
+    if md_entries:
+        with ThreadPoolExecutor(max_workers=min(16, len(md_entries))) as executor:
+            line_counts = list(executor.map(_count_lines, md_entries))
 
-            # Determine category
+    # Collect output and write it once per phase rather than per line
+    out = []
+    for filename, line_count in line_counts:
+        total_files += 1
+        total_lines += line_count
+
+        # Determine category (thresholds mirror length_categories)
+        if line_count <= 100:
             category = 'short'
-            for cat, (min_lines, max_lines) in length_categories.items():
-                if min_lines <= line_count <= max_lines:
-                    category = cat
-                    category_counts[cat] += 1
-                    break
-
-            # Calculate optimization priority
-            if line_count > 500:
-                priority = "🔴 HIGH"
-            elif line_count > 400:
-                priority = "🟡 MEDIUM"
-            elif line_count > 300:
-                priority = "🟢 LOW"
-            else:
-                priority = "✅ NONE"
-
-            results.append({
-                'filename': filename,
-                'line_count': line_count,
-                'category': category,
-                'recommendation': optimization_recommendations[category],
-                'priority': priority
-            })
-
-            # Print individual file analysis
-            print(f"{filename}: {line_count} lines")
-            print(f"  Category: {category.upper().replace('_', ' ')}")
-            print(f"  Priority: {priority}")
-            print(f"  Recommendation: {optimization_recommendations[category]}")
-            print()
+            short_count += 1
+        elif line_count <= 300:
+            category = 'medium'
+            medium_count += 1
+        elif line_count <= 500:
+            category = 'long'
+            long_count += 1
+        else:
+            category = 'very_long'
+            very_long_count += 1
+
+        # Calculate optimization priority
+        if line_count > 500:
+            priority = "🔴 HIGH"
+        elif line_count > 400:
+            priority = "🟡 MEDIUM"
+        elif line_count > 300:
+            priority = "🟢 LOW"
+        else:
+            priority = "✅ NONE"
+
+        result = DocResult(
+            filename=filename,
+            line_count=line_count,
+            category=category,
+            recommendation=optimization_recommendations[category],
+            priority=priority
+        )
+        results.append(result)
+
+        # Collect optimization candidates in the same pass
+        if priority in ("🔴 HIGH", "🟡 MEDIUM"):
+            high_priority.append(result)
+
+        # Print individual file analysis
+        out.append(f"{filename}: {line_count} lines\n")
+        out.append(f"  Category: {_CATEGORY_LABELS[category]}\n")
+        out.append(f"  Priority: {priority}\n")
+        out.append(f"  Recommendation: {optimization_recommendations[category]}\n")
+        out.append("\n")
+    sys.stdout.write(''.join(out))
 
     if total_files == 0:
         print("No markdown files found")
         return results
 
     # Print summary statistics
-    print("📈 Summary Statistics")
-    print("-" * 30)
-    print(f"Total files analyzed: {total_files}")
-    print(f"Total lines: {total_lines}")
-    print(f"Average lines per file: {total_lines / total_files:.1f}")
-    print()
-
-    print("📊 Category Distribution")
-    print("-" * 30)
-    for category, count in sorted(category_counts.items()):
+    out = []
+    out.append("📈 Summary Statistics\n")
+    out.append("-" * 30 + "\n")
+    out.append(f"Total files analyzed: {total_files}\n")
+    out.append(f"Total lines: {total_lines}\n")
+    out.append(f"Average lines per file: {total_lines / total_files:.1f}\n")
+    out.append("\n")
+
+    out.append("📊 Category Distribution\n")
+    out.append("-" * 30 + "\n")
+    category_counts = {
+        'short': short_count,
+        'medium': medium_count,
+        'long': long_count,
+        'very_long': very_long_count
+    }
+    for category, count in category_counts.items():
+        if count == 0:
+            continue
         percentage = (count / total_files) * 100
-        print(f"{category.upper().replace('_', ' ')}: {count} files ({percentage:.1f}%)")
-    print()
-
-    # Identify optimization candidates
-    high_priority = [r for r in results if r['priority'] in ["🔴 HIGH", "🟡 MEDIUM"]]
-    print(f"🎯 Optimization Candidates: {len(high_priority)} files")
-    print("-" * 40)
-    for result in sorted(high_priority, key=lambda x: x['line_count'], reverse=True):
-        print(f"{result['filename']}: {result['line_count']} lines ({result['priority']})")
+        out.append(f"{_CATEGORY_LABELS[category]}: {count} files ({percentage:.1f}%)\n")
+    out.append("\n")
+
+    # Report optimization candidates
+    out.append(f"🎯 Optimization Candidates: {len(high_priority)} files\n")
+    out.append("-" * 40 + "\n")
+    for result in sorted(high_priority, key=lambda x: x.line_count, reverse=True):
+        out.append(f"{result.filename}: {result.line_count} lines ({result.priority})\n")
+    sys.stdout.write(''.join(out))
 
     return results
 